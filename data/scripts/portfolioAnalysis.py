@@ -1,26 +1,90 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from yfinance import Ticker
-import json
+
+try:
+    from orjson import OPT_INDENT_2, dumps, loads
+
+    def dump_json(data):
+        return dumps(data, option=OPT_INDENT_2)
+
+except ImportError:
+    from json import dumps, loads
+
+    def dump_json(data):
+        return dumps(data, indent=2).encode()
+
+
+# Fund allocations rarely change intraday, so reruns reuse a day-old fetch.
+CACHE_DIR = os.path.expanduser("~/.cache/portfolio-yfinance")
+CACHE_TTL = 24 * 60 * 60
+
+
+def fetch_asset_classes(symbol):
+    """Return a fund's asset classes, from the on-disk cache when fresh."""
+    path = os.path.join(CACHE_DIR, f"{symbol}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            with open(path, "rb") as f:
+                return loads(f.read())
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt entries are refetched and rewritten
+        pass
+    asset_classes = {
+        asset_class: float(value)
+        for asset_class, value in Ticker(symbol).get_funds_data().asset_classes.items()
+    }
+    # The cache is best effort: failing to write it must not lose the fetch.
+    # Write to a temporary file and rename it into place, so an interrupted
+    # run never leaves a truncated cache entry behind.
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_json(asset_classes))
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return asset_classes
+
+
+def fetch(symbol):
+    try:
+        return symbol, fetch_asset_classes(symbol)
+    except Exception as e:
+        return symbol, e
+
 
 with open(
     f"{__file__}/../portfolio.json",
-    "r",
+    "rb",
 ) as f:
-    portfolio = json.load(f)
+    portfolio = loads(f.read())
+
+# Each fetch is a network round-trip to Yahoo, so issue them concurrently.
+with ThreadPoolExecutor(max_workers=16) as executor:
+    fetched = list(executor.map(fetch, portfolio.keys()))
 
 data = {}
-for symbol in portfolio.keys():
+for symbol, result in fetched:
     data[symbol] = {
         "assets": {},
         "percentage": portfolio[symbol],
     }
-    try:
-        ticker = Ticker(symbol)
-        asset_classes = ticker.get_funds_data().asset_classes
-        for asset_class in asset_classes:
-            data[symbol]["assets"][asset_class.replace("Position", "")] = asset_classes[
+    if not isinstance(result, Exception):
+        for asset_class in result:
+            data[symbol]["assets"][asset_class.replace("Position", "")] = result[
                 asset_class
             ]
-    except Exception as e:
+    else:
         if symbol == "5021":
             data[symbol]["assets"] = {
                 "cash": 0,
@@ -40,27 +104,21 @@ for symbol in portfolio.keys():
                 "other": 0,
             }
         else:
-            print(e)
+            print(result)
 
-total_breakdown = {}
-# Initialize total breakdown with all possible asset types
+# All possible asset types, in report order
+ASSET_TYPES = ["cash", "stock", "bond", "preferred", "convertible", "other"]
+
+# For each asset type, sum each symbol's share of it weighted by the symbol's
+# portfolio percentage
 total_breakdown = {
-    "cash": 0,
-    "stock": 0,
-    "bond": 0,
-    "preferred": 0,
-    "convertible": 0,
-    "other": 0,
+    asset_type: sum(
+        holding["assets"].get(asset_type, 0) * holding["percentage"]
+        for holding in data.values()
+    )
+    for asset_type in ASSET_TYPES
 }
 
-# For each symbol, multiply its asset percentages by its portfolio percentage
-for symbol in data:
-    symbol_percentage = data[symbol]["percentage"]
-    for asset_type in data[symbol]["assets"]:
-        asset_percentage = data[symbol]["assets"][asset_type]
-        # print(symbol, asset_type, asset_percentage, symbol_percentage)
-        total_breakdown[asset_type] += asset_percentage * symbol_percentage
-
 data = {
     "total_breakdown": total_breakdown,
     "data": data,
@@ -68,6 +126,6 @@ data = {
 
 with open(
     f"{__file__}/../portfolioAnalysis.json",
-    "w",
+    "wb",
 ) as f:
-    json.dump(data, f, indent=4)
+    f.write(dump_json(data))
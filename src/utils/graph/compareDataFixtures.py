@@ -0,0 +1,181 @@
+"""Lazily loaded compareData fixtures and their derived views."""
+
+import array
+import functools
+import gzip
+import hashlib
+import mmap
+import os
+import sys
+from typing import NamedTuple
+
+try:
+    from orjson import OPT_SORT_KEYS, dumps, loads
+
+    def canonical_dumps(data):
+        return dumps(data, option=OPT_SORT_KEYS)
+
+except ImportError:
+    from json import dumps, loads
+
+    def canonical_dumps(data):
+        return dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Entry(NamedTuple):
+    amount: float
+    name: str
+
+
+# Canonical activity entries; equal entries share one Entry.
+_ENTRIES = {}
+
+
+def intern_entry(entry):
+    # Adding 0.0 folds -0.0 into 0.0 so zero amounts print and intern identically.
+    key = Entry(entry["amount"] + 0.0, sys.intern(entry["name"]))
+    return _ENTRIES.setdefault(key, key)
+
+
+def intern_activity(dataset):
+    """Return a copy of dataset whose activity entries are interned.
+
+    The parsed payload itself is left alone, so the report still prints each
+    fixture's entries exactly as they were stored.
+    """
+    datasets = []
+    for ds in dataset["datasets"]:
+        activity = [
+            [intern_entry(entry) for entry in entries] for entries in ds["activity"]
+        ]
+        datasets.append({**ds, "activity": activity})
+    return {**dataset, "datasets": datasets}
+
+
+# Shared across fixtures so name ids from old and new are directly comparable.
+NAMES = []
+_NAME_IDS = {}
+
+
+class ActivityColumns(NamedTuple):
+    """Activity as parallel arrays; bucket i spans offsets[i]:offsets[i + 1]."""
+
+    amount_cents: array.array
+    name_ids: array.array
+    offsets: array.array
+
+
+def name_id(name):
+    ix = _NAME_IDS.get(name)
+    if ix is None:
+        ix = _NAME_IDS[name] = len(NAMES)
+        NAMES.append(name)
+    return ix
+
+
+def to_activity_columns(dataset):
+    """Flatten the per-label activity lists into parallel typed arrays.
+
+    Amounts are stored as integer cents so equal amounts compare exactly.
+    """
+    amount_cents = array.array("q")
+    # 16-bit codes: the vocabulary is a few dozen payees, not thousands.
+    name_ids = array.array("H")
+    offsets = array.array("i", [0])
+    for entries in dataset["datasets"][0]["activity"]:
+        for entry in entries:
+            amount_cents.append(round(entry.amount * 100))
+            name_ids.append(name_id(entry.name))
+        offsets.append(len(amount_cents))
+    return ActivityColumns(amount_cents, name_ids, offsets)
+
+
+def _float_series(values):
+    # Adding 0.0 folds -0.0 into 0.0, as intern_entry does for amounts.
+    return array.array("d", (value + 0.0 for value in values))
+
+
+# Decoded payloads by content digest, so identical fixture files are parsed once.
+# They are never mutated; Fixture.data builds its own interned copy.
+_PAYLOADS = {}
+
+
+class Fixture:
+    """Lazily loaded compareData_<name>.json.gz payload.
+
+    Nothing is read from disk until one of the properties is first accessed,
+    and each property is computed at most once.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.path = os.path.join(FIXTURE_DIR, f"compareData_{name}.json.gz")
+
+    @functools.cached_property
+    def raw(self):
+        """JSON bytes, decompressed straight from an mmap of the file."""
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return gzip.decompress(mm)
+
+    @functools.cached_property
+    def payload(self):
+        """The decoded JSON, shared by fixtures with identical bytes; don't mutate it."""
+        payload = _PAYLOADS.get(self.digest)
+        if payload is None:
+            payload = _PAYLOADS[self.digest] = loads(self.raw)
+        return payload
+
+    @functools.cached_property
+    def labels(self):
+        return self.payload["labels"]
+
+    @functools.cached_property
+    def values(self):
+        """The first dataset's balance series as a float64 array."""
+        return _float_series(self.payload["datasets"][0]["data"])
+
+    @functools.cached_property
+    def data(self):
+        """A copy of the payload with interned activity and float64 balances.
+
+        Interning touches every activity entry, so it is deferred until
+        something needs the activity; labels and values don't trigger it.
+        """
+        dataset = intern_activity(self.payload)
+        for i, ds in enumerate(dataset["datasets"]):
+            ds["data"] = self.values if i == 0 else _float_series(ds["data"])
+        return dataset
+
+    @functools.cached_property
+    def digest(self):
+        return hashlib.blake2b(self.raw, digest_size=16).digest()
+
+    @functools.cached_property
+    def canonical(self):
+        """Key-sorted compact JSON bytes, comparable with plain ==."""
+        return canonical_dumps(self.payload)
+
+    @functools.cached_property
+    def balance_cents(self):
+        """Balance series in integer cents, free of float tails like ...999999."""
+        return array.array("q", (round(value * 100) for value in self.values))
+
+    @functools.cached_property
+    def columns(self):
+        return to_activity_columns(self.data)
+
+    @functools.cached_property
+    def bucket_totals(self):
+        """Net activity per label, in cents."""
+        cents, offsets = self.columns.amount_cents, self.columns.offsets
+        return array.array(
+            "q", (sum(cents[start:stop]) for start, stop in zip(offsets, offsets[1:]))
+        )
+
+
+old = Fixture("old")
+new = Fixture("new")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Regenerate a compareData fixture from a saved account graph response.
+
+Reads an activity graph payload (the JSON returned by
+/api/accounts/:accountId/graph) and writes it, gzip-compressed, to
+compareData_<name>.json.gz next to this script. The payload can come from
+a saved file, stdin, or straight from a running server; set BILLS_TOKEN
+when the server has auth enabled.
+
+Usage:
+    python3 src/utils/graph/regenCompareData.py old graph.json
+    python3 src/utils/graph/regenCompareData.py new - < graph.json
+    python3 src/utils/graph/regenCompareData.py new \
+        "http://localhost:5002/api/accounts/<id>/graph?startDate=2025-01-23"
+"""
+
+import gzip
+import json
+import os
+import sys
+import urllib.request
+
+from compareDataFixtures import Fixture
+
+
+def read_graph(source):
+    if source.startswith(("http://", "https://")):
+        request = urllib.request.Request(source)
+        token = os.environ.get("BILLS_TOKEN")
+        if token:
+            request.add_header("Authorization", token)
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+    if source == "-":
+        return json.load(sys.stdin)
+    with open(source, "r") as f:
+        return json.load(f)
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ("old", "new"):
+        print("Usage: regenCompareData.py old|new <graph.json|url|->", file=sys.stderr)
+        sys.exit(1)
+    name, source = sys.argv[1:]
+
+    graph = read_graph(source)
+    if graph.get("type") != "activity":
+        print("ERROR: expected an activity graph payload", file=sys.stderr)
+        sys.exit(1)
+
+    # mtime=0 keeps the archive byte-identical when the payload hasn't changed
+    raw = json.dumps(graph, indent=2).encode()
+    path = Fixture(name).path
+    with open(path, "wb") as f:
+        f.write(gzip.compress(raw, compresslevel=9, mtime=0))
+    print(f"Wrote {len(graph['labels'])} labels to {path}")
+
+
+if __name__ == "__main__":
+    main()